@@ -22,6 +22,7 @@ __all__ = [
     "Callback",
     "Model",
 ]
+import functools
 import inspect
 from abc import ABC
 from typing import Any, List, Optional, Tuple, Union
@@ -55,6 +56,8 @@ from oneflow.compatible.single_client.ops.optimizer import Optimizer
 
 
 class DataModule(Module):
+    _is_numpy_data = False
+
     def __init__(self, *args, **kwargs):
         super().__init__()
 
@@ -68,6 +71,8 @@ class DataModule(Module):
 
 
 class NumpyDataModule(DataModule):
+    _is_numpy_data = True
+
     def __init__(self, *args, **kwargs):
         super().__init__()
 
@@ -261,8 +266,9 @@ class Model(ABC, Module):
             return
         if self._checkpoint_model.is_valid:
             self._checkpoint_model.load()
-        for step_idx in range(0, self._max_steps):
-            for sub_model in self._sub_models:
+        sub_models = self._sub_models
+        for step_idx in range(self._max_steps):
+            for sub_model in sub_models:
                 try:
                     sub_model.step(step_idx)
                 except Exception as e:
@@ -270,9 +276,11 @@ class Model(ABC, Module):
                         "Model step_idx {} {} failed.".format(step_idx, sub_model.name)
                     )
                     raise e
+        if self._val_model.is_valid:
+            self._val_model.join()
 
     def method_overrided(self, method_name: str = None) -> bool:
-        return getattr(self.__class__, method_name) != getattr(Model, method_name)
+        return _method_overrided(self.__class__, method_name)
 
     def _get_and_check_sub_models(
         self,
@@ -319,7 +327,8 @@ class Model(ABC, Module):
             else CheckpointModelOOPStyle(checkpoint_config, self, callbacks)
         )
         if self._checkpoint_model.is_valid:
-            sub_models.append(self._checkpoint_model)
+            if self._checkpoint_model._need_save:
+                sub_models.append(self._checkpoint_model)
         elif checkpoint_config is not None:
             print(
                 self._checkpoint_model.error_msg,
@@ -343,10 +352,24 @@ class SubModel(ABC):
             self.is_valid = False
         if not self._get_and_check_cbs():
             self.is_valid = False
+        self._cb_methods = {
+            method_name: [
+                getattr(cb, method_name)
+                for cb in self._cbs
+                if getattr(type(cb), method_name) is not getattr(Callback, method_name)
+            ]
+            for method_name in ("on_training_step_end", "on_validation_step_end")
+        }
+        self._has_cbs = any(self._cb_methods.values())
 
     def step(self, step_idx: int = 0):
         raise NotImplementedError
 
+    def join(self):
+        """Block until asynchronous work launched by this sub-model has finished.
+        """
+        pass
+
     def _get_and_check_cfg(self):
         if self._cfg is None:
             self.error_msg += "config is None;"
@@ -375,8 +398,7 @@ class SubModel(ABC):
         ), "model callbacks' type must be model.Callback or List[model.Callback]."
 
     def _method_callback(self, method_name: str = None, *args, **kwargs):
-        for cb in self._cbs:
-            method = getattr(cb, method_name)
+        for method in self._cb_methods[method_name]:
             method(*args, **kwargs)
 
 
@@ -394,26 +416,32 @@ class TrainModel(SubModel):
             self.is_valid = False
         if self.is_valid and (not self._get_and_check_jobs()):
             self.is_valid = False
+        self._n_opts = len(self._opts)
 
     def step(self, step_idx: int = 0):
         assert self.is_valid, self.error_msg
-        for optimizer_idx in range(0, len(self._opts)):
-            outputs = None
-            if self._is_numpy_input:
-                batch = None
+        data = self._cfg.data
+        jobs = self._jobs
+        futures = []
+        if self._is_numpy_input:
+            for optimizer_idx in range(self._n_opts):
                 if step_idx == 0:
                     batch = self._first_numpy_batch[optimizer_idx]
                 else:
-                    batch = self._cfg.data(step_idx, optimizer_idx)
-                outputs = self._jobs[optimizer_idx](*batch).get()
-            else:
-                outputs = self._jobs[optimizer_idx]().get()
-            self._method_callback(
-                "on_training_step_end",
-                outputs=outputs,
-                step_idx=step_idx,
-                optimizer_idx=optimizer_idx,
-            )
+                    batch = data(step_idx, optimizer_idx)
+                futures.append(jobs[optimizer_idx](*batch))
+        else:
+            for optimizer_idx in range(self._n_opts):
+                futures.append(jobs[optimizer_idx]())
+        for (optimizer_idx, future) in enumerate(futures):
+            outputs = future.get()
+            if self._has_cbs:
+                self._method_callback(
+                    "on_training_step_end",
+                    outputs=outputs,
+                    step_idx=step_idx,
+                    optimizer_idx=optimizer_idx,
+                )
 
     def _get_and_check_step(self):
         if not self._model.method_overrided("training_step"):
@@ -428,50 +456,46 @@ class TrainModel(SubModel):
             self.error_msg += "model.configure_optimizers() is empty;"
             return False
         opt_conf = self._model.configure_optimizers()
-        if isinstance(opt_conf, Optimizer):
-            self._opts = [opt_conf]
-        elif isinstance(opt_conf, (list, tuple)):
-            for opt in opt_conf:
-                assert isinstance(
-                    opt, Optimizer
-                ), "model.configure_optimizers() must return Optimizer                     or List[Optimizer, ...] or Tuple[Optimizer, ...]"
-            self._opts = opt_conf
-        else:
-            assert (
-                False
-            ), "model.configure_optimizers() must return Optimizer                 or List[Optimizer, ...] or Tuple[Optimizer, ...]"
+        if not isinstance(opt_conf, (list, tuple)):
+            opt_conf = [opt_conf]
+        for opt in opt_conf:
+            assert isinstance(
+                opt, Optimizer
+            ), "model.configure_optimizers() must return Optimizer                     or List[Optimizer, ...] or Tuple[Optimizer, ...]"
+        self._opts = tuple(opt_conf)
         return True
 
     def _get_and_check_jobs(self):
-        self._is_numpy_input = (
-            True if isinstance(self._cfg.data, NumpyDataModule) else False
-        )
-        self._jobs = []
+        self._is_numpy_input = self._cfg.data._is_numpy_data
+        n_opts = len(self._opts)
         if self._is_numpy_input:
-            self._first_numpy_batch = []
-            for optimizer_idx in range(0, len(self._opts)):
-                batch = self._cfg.data(0, optimizer_idx)
-                self._first_numpy_batch.insert(optimizer_idx, batch)
-                self._jobs.insert(
-                    optimizer_idx, self._construct_numpy_job(batch, optimizer_idx)
-                )
+            self._first_numpy_batch = [
+                self._cfg.data(0, optimizer_idx) for optimizer_idx in range(n_opts)
+            ]
+            self._jobs = tuple(
+                self._construct_numpy_job(batch, optimizer_idx)
+                for (optimizer_idx, batch) in enumerate(self._first_numpy_batch)
+            )
         else:
-            for optimizer_idx in range(0, len(self._opts)):
-                self._jobs.insert(optimizer_idx, self._construct_job(optimizer_idx))
+            self._jobs = tuple(
+                self._construct_job(optimizer_idx) for optimizer_idx in range(n_opts)
+            )
         return True
 
     def _construct_job(self, optimizer_idx: int = 0):
+        data = self._cfg.data
+        training_step = self._model.training_step
+        minimize = self._opts[optimizer_idx].minimize
+
         def job():
-            batch = self._cfg.data(0, optimizer_idx)
-            outputs = self._model.training_step(
-                batch=batch, optimizer_idx=optimizer_idx
-            )
+            batch = data(0, optimizer_idx)
+            outputs = training_step(batch=batch, optimizer_idx=optimizer_idx)
             loss = None
             if isinstance(outputs, tuple) and len(outputs) > 0:
                 loss = outputs[0]
             else:
                 loss = outputs
-            self._opts[optimizer_idx].minimize(loss)
+            minimize(loss)
             return outputs
 
         job.__name__ = (
@@ -481,16 +505,17 @@ class TrainModel(SubModel):
         return deco(job)
 
     def _construct_numpy_job(self, batch, optimizer_idx):
+        training_step = self._model.training_step
+        minimize = self._opts[optimizer_idx].minimize
+
         def job(*input_batch):
-            outputs = self._model.training_step(
-                batch=input_batch, optimizer_idx=optimizer_idx
-            )
+            outputs = training_step(batch=input_batch, optimizer_idx=optimizer_idx)
             loss = None
             if isinstance(outputs, tuple) and len(outputs) > 0:
                 loss = outputs[0]
             else:
                 loss = outputs
-            self._opts[optimizer_idx].minimize(loss)
+            minimize(loss)
             return outputs
 
         _infer_job_signature(self._cfg.data, batch, optimizer_idx, job)
@@ -515,20 +540,38 @@ class ValidateModel(SubModel):
             self.is_valid = False
         if self.is_valid and (not self._get_and_check_job()):
             self.is_valid = False
+        if self.is_valid:
+            step_interval = self._cfg.step_interval
+            self._val_steps = frozenset(
+                range(step_interval - 1, self._model._max_steps, step_interval)
+            )
+        self._pending = None
 
     def step(self, step_idx: int = 0):
         assert self.is_valid
-        if (step_idx + 1) % self._cfg.step_interval == 0:
-            outputs = None
+        self._fetch_pending_result()
+        if step_idx in self._val_steps:
             if self._is_numpy_input:
-                batch = None
                 if step_idx == 0:
                     batch = self._first_numpy_batch
                 else:
                     batch = self._cfg.data(step_idx, 0)
-                outputs = self._job(*batch).get()
+                self._pending = (step_idx, self._job(*batch))
             else:
-                outputs = self._job().get()
+                self._pending = (step_idx, self._job())
+
+    def join(self):
+        """Block until the last launched validation job has been fetched.
+        """
+        self._fetch_pending_result()
+
+    def _fetch_pending_result(self):
+        if self._pending is None:
+            return
+        (step_idx, future) = self._pending
+        self._pending = None
+        outputs = future.get()
+        if self._has_cbs:
             self._method_callback(
                 "on_validation_step_end", step_idx=step_idx, outputs=outputs
             )
@@ -541,9 +584,7 @@ class ValidateModel(SubModel):
             return True
 
     def _get_and_check_job(self):
-        self._is_numpy_input = (
-            True if isinstance(self._cfg.data, NumpyDataModule) else False
-        )
+        self._is_numpy_input = self._cfg.data._is_numpy_data
         self._job = None
         if not self._is_numpy_input:
             self._job = self._construct_job()
@@ -554,17 +595,22 @@ class ValidateModel(SubModel):
         return True
 
     def _construct_job(self):
+        data = self._cfg.data
+        validation_step = self._model.validation_step
+
         def job():
-            batch = self._cfg.data(0, 0)
-            return self._model.validation_step(batch)
+            batch = data(0, 0)
+            return validation_step(batch)
 
         job.__name__ = self._model.__class__.__name__ + "_Model_eval_job"
         deco = api_oneflow_function(type="predict", function_config=self._cfg.exe_cfg)
         return deco(job)
 
     def _construct_numpy_job(self, batch: Tuple[np.ndarray, ...] = None):
+        validation_step = self._model.validation_step
+
         def job(*input_batch):
-            return self._model.validation_step(batch=input_batch)
+            return validation_step(batch=input_batch)
 
         _infer_job_signature(self._cfg.data, batch, 0, job)
         job.__name__ = self._model.__class__.__name__ + "_Model_eval_numpy_job"
@@ -580,6 +626,14 @@ class CheckpointModel(SubModel):
         callbacks: Optional[Union[Callback, List[Callback]]] = None,
     ):
         super().__init__("checkpointing", cfg, model, callbacks)
+        if self.is_valid:
+            self._need_save = self._cfg.need_save
+            self._save_dirpath = self._cfg.save_dirpath
+            if self._need_save:
+                save_step_interval = self._cfg.save_step_interval
+                self._save_steps = frozenset(
+                    range(save_step_interval - 1, model._max_steps, save_step_interval)
+                )
 
     def load(self):
         assert self.is_valid
@@ -588,11 +642,8 @@ class CheckpointModel(SubModel):
 
     def step(self, step_idx: int = 0):
         assert self.is_valid
-        if self._cfg.need_save:
-            if (step_idx + 1) % self._cfg.save_step_interval == 0:
-                self._save_checkpoint(
-                    dirpath=self._cfg.save_dirpath + "-" + str(step_idx)
-                )
+        if self._need_save and step_idx in self._save_steps:
+            self._save_checkpoint(dirpath="{}-{}".format(self._save_dirpath, step_idx))
 
     def _load_checkpoint(self, dirpath: str):
         """Load model states from a checkpoint.
@@ -617,11 +668,14 @@ class TrainModelOOPStyle(SubModel):
             self.is_valid = False
         if not self._get_and_check_opts():
             self.is_valid = False
+        self._n_opts = len(self._opts)
 
     def step(self, step_idx: int = 0):
         assert self.is_valid, self.error_msg
-        for optimizer_idx in range(0, len(self._opts)):
-            batch = self._cfg.data(step_idx, optimizer_idx)
+        data = self._cfg.data
+        opts = self._opts
+        for optimizer_idx in range(self._n_opts):
+            batch = data(step_idx, optimizer_idx)
             outputs = self._model.training_step(
                 batch=batch, optimizer_idx=optimizer_idx
             )
@@ -631,15 +685,16 @@ class TrainModelOOPStyle(SubModel):
             else:
                 loss = outputs
             loss.backward()
-            opt = self._opts[optimizer_idx]
+            opt = opts[optimizer_idx]
             opt.step()
             opt.zero_grad()
-            self._method_callback(
-                "on_training_step_end",
-                outputs=outputs,
-                step_idx=step_idx,
-                optimizer_idx=optimizer_idx,
-            )
+            if self._has_cbs:
+                self._method_callback(
+                    "on_training_step_end",
+                    outputs=outputs,
+                    step_idx=step_idx,
+                    optimizer_idx=optimizer_idx,
+                )
 
     def _get_and_check_step(self):
         if not self._model.method_overrided("training_step"):
@@ -654,18 +709,13 @@ class TrainModelOOPStyle(SubModel):
             self.error_msg += "model.configure_optimizers() is empty;"
             return False
         opt_conf = self._model.configure_optimizers()
-        if isinstance(opt_conf, OOPOptimizer):
-            self._opts = [opt_conf]
-        elif isinstance(opt_conf, (list, tuple)):
-            for opt in opt_conf:
-                assert isinstance(
-                    opt, OOPOptimizer
-                ), "model.configure_optimizers() must return Optimizer                     or List[Optimizer, ...] or Tuple[Optimizer, ...]"
-            self._opts = opt_conf
-        else:
-            assert (
-                False
-            ), "model.configure_optimizers() must return Optimizer                 or List[Optimizer, ...] or Tuple[Optimizer, ...]"
+        if not isinstance(opt_conf, (list, tuple)):
+            opt_conf = [opt_conf]
+        for opt in opt_conf:
+            assert isinstance(
+                opt, OOPOptimizer
+            ), "model.configure_optimizers() must return Optimizer                     or List[Optimizer, ...] or Tuple[Optimizer, ...]"
+        self._opts = tuple(opt_conf)
         return True
 
 
@@ -679,10 +729,15 @@ class ValidateModelOOPStyle(SubModel):
         super().__init__("validation", cfg, model, callbacks)
         if not self._get_and_check_step():
             self.is_valid = False
+        if self.is_valid:
+            step_interval = self._cfg.step_interval
+            self._val_steps = frozenset(
+                range(step_interval - 1, self._model._max_steps, step_interval)
+            )
 
     def step(self, step_idx: int = 0):
         assert self.is_valid
-        if (step_idx + 1) % self._cfg.step_interval == 0:
+        if step_idx in self._val_steps:
             outputs = None
             with oneflow._oneflow_internal.autograd.no_grad():
                 inputs = self._cfg.data(step_idx, 0)
@@ -690,9 +745,10 @@ class ValidateModelOOPStyle(SubModel):
                 self._model.train()
                 outputs = self._model.validation_step(inputs)
                 self._model.train(model_previous_mode)
-            self._method_callback(
-                "on_validation_step_end", step_idx=step_idx, outputs=outputs
-            )
+            if self._has_cbs:
+                self._method_callback(
+                    "on_validation_step_end", step_idx=step_idx, outputs=outputs
+                )
 
     def _get_and_check_step(self):
         if not self._model.method_overrided("validation_step"):
@@ -710,6 +766,14 @@ class CheckpointModelOOPStyle(SubModel):
         callbacks: Optional[Union[Callback, List[Callback]]] = None,
     ):
         super().__init__("checkpointing", cfg, model, callbacks)
+        if self.is_valid:
+            self._need_save = self._cfg.need_save
+            self._save_dirpath = self._cfg.save_dirpath
+            if self._need_save:
+                save_step_interval = self._cfg.save_step_interval
+                self._save_steps = frozenset(
+                    range(save_step_interval - 1, model._max_steps, save_step_interval)
+                )
 
     def load(self):
         assert self.is_valid
@@ -718,11 +782,8 @@ class CheckpointModelOOPStyle(SubModel):
 
     def step(self, step_idx: int = 0):
         assert self.is_valid
-        if self._cfg.need_save:
-            if (step_idx + 1) % self._cfg.save_step_interval == 0:
-                self._save_checkpoint(
-                    dirpath=self._cfg.save_dirpath + "-" + str(step_idx)
-                )
+        if self._need_save and step_idx in self._save_steps:
+            self._save_checkpoint(dirpath="{}-{}".format(self._save_dirpath, step_idx))
 
     def _load_checkpoint(self, dirpath: str):
         """Load model states from a checkpoint.
@@ -737,6 +798,11 @@ class CheckpointModelOOPStyle(SubModel):
         SaveVarDict(path=dirpath, var_dict=stat_dict)
 
 
+@functools.lru_cache(maxsize=None)
+def _method_overrided(cls, method_name):
+    return getattr(cls, method_name) != getattr(Model, method_name)
+
+
 def _infer_job_signature(data_module, batch, optimizer_idx, job):
     para_list = []
     placeholder_list = data_module.infer_oneflow_data_placeholder(batch, optimizer_idx)
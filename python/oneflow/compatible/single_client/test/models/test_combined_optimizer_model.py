@@ -0,0 +1,108 @@
+"""
+Copyright 2020 The OneFlow Authors. All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import os
+import unittest
+
+import numpy as np
+
+import oneflow.compatible.single_client.unittest
+from oneflow.compatible import single_client as flow
+
+
+class MultiLossModel(flow.model.Model):
+    """A model trained by one CombinedOptimizer.
+
+    training_step returns the list of losses as the loss entry of its
+    output, so a single fused train job registers every loss.
+    """
+
+    def __init__(self, lr, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lr = lr
+
+    def training_step(self, batch, optimizer_idx):
+        assert optimizer_idx == 0
+        (x,) = batch
+        var1 = flow.get_variable(
+            name="var1",
+            shape=x.shape,
+            dtype=flow.float32,
+            initializer=flow.constant_initializer(5.0),
+            trainable=True,
+        )
+        var2 = flow.get_variable(
+            name="var2",
+            shape=x.shape,
+            dtype=flow.float32,
+            initializer=flow.constant_initializer(-3.0),
+            trainable=True,
+        )
+        loss1 = flow.math.reduce_sum(flow.math.square(var1 - x))
+        loss2 = flow.math.reduce_sum(flow.math.square(var2 - x))
+        return [loss1, loss2]
+
+    def configure_optimizers(self):
+        sgd1 = flow.optimizer.SGD(
+            flow.optimizer.PiecewiseConstantScheduler([], [self.lr]),
+            momentum=0,
+            variables=["var1"],
+        )
+        sgd2 = flow.optimizer.SGD(
+            flow.optimizer.PiecewiseConstantScheduler([], [self.lr]),
+            momentum=0,
+            variables=["var2"],
+        )
+        return flow.optimizer.CombinedOptimizer([sgd1, sgd2])
+
+
+class TrainData(flow.model.NumpyDataModule):
+    def __init__(self, batch_size):
+        super().__init__()
+        self.x = np.ones((batch_size, 4), dtype=np.float32)
+
+    def forward(self, step_idx, optimizer_idx):
+        return (self.x,)
+
+
+class LossMoniter(flow.model.Callback):
+    def __init__(self):
+        self.losses = []
+
+    def on_training_step_end(self, step_idx, outputs, optimizer_idx):
+        assert optimizer_idx == 0
+        (loss1, loss2) = outputs
+        self.losses.append((loss1.numpy().mean(), loss2.numpy().mean()))
+
+
+@unittest.skipIf(os.getenv("ONEFLOW_TEST_CPU_ONLY"), "only test cpu cases")
+def test_combined_optimizer_1n1c(test_case):
+    flow.config.gpu_device_num(1)
+    train_exe_config = flow.ExecutionConfig()
+    train_exe_config.default_data_type(flow.float)
+    train_exe_config.default_logical_view(flow.scope.consistent_view())
+    train_config = flow.model.TrainingConfig()
+    train_config.config_execution(train_exe_config)
+    train_config.config_data(TrainData(batch_size=8))
+    loss_monitor_cb = LossMoniter()
+    multi_loss_md = MultiLossModel(lr=0.1, is_deprecated_function_style=True)
+    multi_loss_md.fit(
+        training_config=train_config, callbacks=[loss_monitor_cb], max_steps=5
+    )
+    (first_loss1, first_loss2) = loss_monitor_cb.losses[0]
+    (last_loss1, last_loss2) = loss_monitor_cb.losses[-1]
+    assert last_loss1 < first_loss1, "{}-{}".format(last_loss1, first_loss1)
+    assert last_loss2 < first_loss2, "{}-{}".format(last_loss2, first_loss2)
@@ -20,40 +20,43 @@ import numpy as np
 import oneflow as flow
 import oneflow.unittest
 
+_INPUT_ARR = np.array(
+    [
+        [-0.94630778, -0.83378579, -0.87060891],
+        [2.0289922, -0.28708987, -2.18369248],
+        [0.35217619, -0.67095644, -1.58943879],
+        [0.08086036, -1.81075924, 1.20752494],
+        [0.8901075, -0.49976737, -1.07153746],
+        [-0.44872912, -1.07275683, 0.06256855],
+        [-0.22556897, 0.74798368, 0.90416439],
+        [0.48339456, -2.32742195, -0.59321527],
+    ],
+    dtype=np.float32,
+)
+
 
 @unittest.skipIf(os.getenv("ONEFLOW_TEST_CPU_ONLY"), "only test cpu cases")
 @flow.unittest.skip_unless_1n1d()
 class TestCopyGraph(oneflow.unittest.TestCase):
     def test_copy_graph(test_case):
         linear = flow.nn.Linear(3, 8, False)
-        input_arr = np.array(
-            [
-                [-0.94630778, -0.83378579, -0.87060891],
-                [2.0289922, -0.28708987, -2.18369248],
-                [0.35217619, -0.67095644, -1.58943879],
-                [0.08086036, -1.81075924, 1.20752494],
-                [0.8901075, -0.49976737, -1.07153746],
-                [-0.44872912, -1.07275683, 0.06256855],
-                [-0.22556897, 0.74798368, 0.90416439],
-                [0.48339456, -2.32742195, -0.59321527],
-            ],
-            dtype=np.float32,
-        )
-        np_weight = np.ones((3, 8)).astype(np.float32)
-        np_weight.fill(2.3)
+        input_arr = _INPUT_ARR
+        np_weight = np.full((3, 8), 2.3, dtype=np.float32)
         x = flow.tensor(input_arr)
         flow.nn.init.constant_(linear.weight, 2.3)
         of_eager_out = linear(x)
         np_out = np.matmul(input_arr, np_weight)
         test_case.assertTrue(np.allclose(of_eager_out.numpy(), np_out, 1e-05, 1e-05))
 
+        cuda_device = flow.device("cuda")
+
         class LinearGraph(flow.nn.Graph):
             def __init__(self):
                 super().__init__()
-                self.my_linear = linear.to(flow.device("cuda"))
+                self.my_linear = linear.to(cuda_device)
 
             def build(self, x):
-                x = x.to(flow.device("cuda"))
+                x = x.to(cuda_device)
                 return self.my_linear(x)
 
         linear_g = LinearGraph()